@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # /// script
-# requires-python = ">=3.7"
+# requires-python = ">=3.9"
 # ///
 """
 Generate Test Sample Files for LTC to SMPTE Converter
@@ -35,9 +35,56 @@ Examples:
 """
 
 import argparse
-import subprocess
+import asyncio
+import getpass
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import stat
 import sys
+import tempfile
+import time
+from collections import deque
 from pathlib import Path
+from typing import Sequence
+
+# Number of trailing stderr lines kept per subprocess for error reporting
+STDERR_TAIL_LINES = 200
+
+# HH:MM:SS:FF; hours and frames are range-checked separately
+TIMECODE_RE = re.compile(r"^([0-2]\d):([0-5]\d):([0-5]\d):(\d{2})$")
+
+# Frame rate ltcgen encodes at when none is given
+LTCGEN_FPS = 25
+
+# Successful tool lookups are cached per PATH value for this many seconds
+TOOL_CACHE_DIR = Path.home() / ".cache" / "ltc_to_smpte"
+TOOL_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Input options that keep ffmpeg/ffprobe from probing our trivially described
+# inputs; they must precede each -i they apply to
+FAST_PROBE_ARGS = ["-probesize", "32", "-analyzeduration", "0", "-fflags", "+fastseek"]
+
+def _private_scratch_dir(base: Path) -> Path:
+    """Return a per-user, mode 0700 subdirectory of base for intermediates
+    
+    base is usually world-writable (/dev/shm, /tmp), where fixed file names
+    could be pre-created or planted by another user. If the per-user
+    directory is not ours or not private, a fresh mkdtemp one is used instead.
+    """
+    uid = os.getuid() if hasattr(os, "getuid") else None
+    path = base / f"ltc_to_smpte-{uid if uid is not None else getpass.getuser()}"
+    try:
+        path.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    st = path.lstat()
+    if not stat.S_ISDIR(st.st_mode) or (uid is not None and st.st_uid != uid) or st.st_mode & 0o077:
+        return Path(tempfile.mkdtemp(prefix="ltc_to_smpte-", dir=base))
+    return path
 
 class TestSampleGenerator:
     """Generates test sample files for LTC processing"""
@@ -57,115 +104,211 @@ class TestSampleGenerator:
         self.output_prefix = output_prefix
         self.verbose = verbose
         
+        # Absolute tool paths, filled in by check_requirements and _run
+        self._tool_paths: dict[str, str] = {}
+        
+        # Single stdout handler; the level gate makes disabled log calls cheap
+        self._log = logging.getLogger("ltc_sample")
+        self._log.setLevel(logging.INFO if verbose else logging.WARNING)
+        if not self._log.handlers:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+            self._log.addHandler(handler)
+            self._log.propagate = False
+        
+        # Intermediates go to a private scratch dir (tmpfs where available),
+        # only the final video is written next to the output prefix
+        default_scratch = "/dev/shm" if Path("/dev/shm").is_dir() else tempfile.gettempdir()
+        self._scratch = _private_scratch_dir(Path(os.environ.get("TMPDIR", default_scratch)))
+        
         # Define output files
-        self.ltc_audio_file = f"{output_prefix}_ltc.wav"
-        self.test_video_file = f"{output_prefix}_with_ltc.mp4"
-        self.tone_audio_file = f"{output_prefix}_tone.wav"
+        self.ltc_audio_file = str(self._scratch / f"{Path(output_prefix).name}_ltc.wav")
+        # MOV so the audio can stay PCM; AAC smears the LTC square wave
+        self.test_video_file = f"{output_prefix}_with_ltc.mov"
+        
+        # Commands are fixed for a given configuration, so build them once.
+        # ltcgen writes WAV through libsndfile, which cannot write WAV to a
+        # pipe or FIFO (no header seek-back), so the LTC track has to go
+        # through a real file rather than ffmpeg's stdin.
+        self._ltcgen_cmd = (
+            "ltcgen",
+            "-t", self.timecode,
+            "-l", str(self.duration),
+            self.ltc_audio_file
+        )
+        
+        # Create video with merged audio (left=tone, right=ltc)
+        self._video_cmd = (
+            "ffmpeg",
+            *FAST_PROBE_ARGS,
+            "-f", "lavfi",
+            "-i", f"color=c=blue:s=320x240:d={self.duration}",
+            *FAST_PROBE_ARGS,
+            "-f", "lavfi",
+            "-i", f"sine=f=100:d={self.duration}",
+            *FAST_PROBE_ARGS,
+            "-i", self.ltc_audio_file,
+            "-filter_complex", "[1:a][2:a]join=inputs=2:channel_layout=stereo[a]",
+            "-map", "0:v",
+            "-map", "[a]",
+            "-c:v", "libx264",
+            "-preset", "ultrafast",
+            "-tune", "zerolatency",
+            "-threads", "0",
+            # Solid colour: no motion to search, so skip B-frames and references
+            "-g", "1",
+            "-bf", "0",
+            "-refs", "1",
+            "-c:a", "pcm_s16le",
+            "-shortest",
+            "-y",
+            self.test_video_file
+        )
+        
+        # Simple verification - check if file has audio streams
+        self._probe_cmd = (
+            "ffprobe",
+            "-v", "error",
+            "-select_streams", "a",
+            "-show_entries", "stream=channels",
+            "-of", "csv=p=0",
+            "-read_intervals", "%+#1",
+            *FAST_PROBE_ARGS,
+            self.test_video_file
+        )
         
         self.log(f"Initializing test sample generator with timecode {timecode}")
     
     def log(self, message: str, level: str = "INFO"):
-        """Print log message if verbose"""
-        if self.verbose:
-            print(f"[{level}] {message}")
+        """Log message at the given level (INFO is shown only if verbose)"""
+        self._log.log(getattr(logging, level), message)
+    
+    async def _run(self, cmd: Sequence[str], capture_stdout: bool = False) -> tuple[int, str, str]:
+        """Run a command, draining stderr incrementally into a bounded buffer
+        
+        Args:
+            cmd: Command and arguments
+            capture_stdout: Collect stdout instead of discarding it
+        
+        Returns:
+            Tuple of (returncode, stdout, last STDERR_TAIL_LINES of stderr)
+        """
+        # An absolute executable path lets CPython launch via posix_spawn
+        # instead of fork+exec (it only does so when the path has a directory)
+        executable = self._tool_paths.get(cmd[0])
+        if executable is None:
+            executable = self._tool_paths[cmd[0]] = shutil.which(cmd[0]) or cmd[0]
+        proc = await asyncio.create_subprocess_exec(
+            executable, *cmd[1:],
+            stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stderr_tail: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+        
+        async def drain_stderr():
+            # Read in chunks rather than lines: ffmpeg progress uses bare '\r'
+            # and can exceed the StreamReader line limit
+            while chunk := await proc.stderr.read(65536):
+                stderr_tail.extend(chunk.decode(errors="replace").splitlines(keepends=True))
+        
+        if capture_stdout:
+            stdout_bytes, _ = await asyncio.gather(proc.stdout.read(), drain_stderr())
+        else:
+            stdout_bytes = b""
+            await drain_stderr()
+        await proc.wait()
+        return proc.returncode, stdout_bytes.decode(errors="replace"), "".join(stderr_tail)
     
     def check_requirements(self) -> bool:
-        """Check if required tools are installed"""
+        """Check if required tools are installed
+        
+        A successful lookup is cached in TOOL_CACHE_DIR, keyed by PATH, so
+        repeated runs skip the scan while the cache is fresh and every cached
+        path is still executable.
+        """
         required_tools = ["ffmpeg", "ltcgen"]
-        missing_tools = []
+        path_hash = hashlib.blake2b(os.environ.get("PATH", "").encode(), digest_size=8).hexdigest()
+        cache_file = TOOL_CACHE_DIR / f"tools_{path_hash}.json"
         
-        for tool in required_tools:
-            result = subprocess.run(
-                ["which", tool],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0:
-                missing_tools.append(tool)
+        try:
+            if time.time() - cache_file.stat().st_mtime < TOOL_CACHE_MAX_AGE:
+                cached = json.loads(cache_file.read_text())
+                # Ignore a cache of the wrong shape; one stat per tool catches
+                # binaries removed since caching
+                if isinstance(cached, dict) and all(
+                    isinstance(cached.get(tool), str) and os.access(cached[tool], os.X_OK)
+                    for tool in required_tools
+                ):
+                    self._tool_paths.update(cached)
+                    self.log("✓ All required tools found (cached)")
+                    return True
+        except (OSError, ValueError):
+            pass  # No usable cache, fall through to a fresh scan
+        
+        tool_paths = {tool: shutil.which(tool) for tool in required_tools}
+        missing_tools = [tool for tool, path in tool_paths.items() if path is None]
         
         if missing_tools:
-            print(f"❌ Error: Missing required tools: {', '.join(missing_tools)}")
-            print("\nInstall them with:")
-            print("  brew install ffmpeg ltc-tools  # macOS")
-            print("  sudo apt-get install ffmpeg ltc-tools  # Ubuntu/Debian")
+            self._log.error(
+                "❌ Error: Missing required tools: %s\n\n"
+                "Install them with:\n"
+                "  brew install ffmpeg ltc-tools  # macOS\n"
+                "  sudo apt-get install ffmpeg ltc-tools  # Ubuntu/Debian",
+                ", ".join(missing_tools)
+            )
             return False
         
+        self._tool_paths.update(tool_paths)
+        try:
+            TOOL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(tool_paths))
+        except OSError as e:
+            self.log(f"Could not write tool cache: {e}", level="WARNING")
+        
         self.log("✓ All required tools found")
         return True
     
-    def generate_ltc_audio(self) -> bool:
+    async def generate_ltc_audio(self) -> bool:
         """Generate LTC audio file using ltcgen
         
+        The output is deterministic for a given timecode and duration, so a
+        previous file is reused when its .meta sidecar records the same key.
+        
         Returns:
             True if successful, False otherwise
         """
-        self.log(f"Generating LTC audio: {self.ltc_audio_file}")
-        
-        try:
-            cmd = [
-                "ltcgen",
-                "-t", self.timecode,
-                "-l", str(self.duration),
-                self.ltc_audio_file
-            ]
-            
-            if self.verbose:
-                print(f"Command: {' '.join(cmd)}")
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-            
-            if result.returncode != 0:
-                print("❌ Error generating LTC audio:")
-                print(result.stderr)
-                return False
-            
-            self.log(f"✓ Created LTC audio: {self.ltc_audio_file}")
+        cache_key = f"ltc_{self.timecode}_d{self.duration}"
+        meta_file = Path(f"{self.ltc_audio_file}.meta")
+        if Path(self.ltc_audio_file).exists() and meta_file.exists() and meta_file.read_text() == cache_key:
+            self.log(f"✓ LTC audio cache hit: {self.ltc_audio_file}")
             return True
         
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            return False
-    
-    def generate_tone_audio(self) -> bool:
-        """Generate reference tone audio (100 Hz sine wave)
-        
-        Returns:
-            True if successful, False otherwise
-        """
-        self.log(f"Generating tone audio: {self.tone_audio_file}")
+        self.log(f"Generating LTC audio: {self.ltc_audio_file}")
         
         try:
-            cmd = [
-                "ffmpeg",
-                "-f", "lavfi",
-                "-i", f"sine=f=100:d={self.duration}",
-                "-b:a", "192k",
-                "-q:a", "9",
-                "-y",
-                self.tone_audio_file
-            ]
-            
-            if self.verbose:
-                print(f"Command: {' '.join(cmd)}")
+            # Invalidate first: an interrupted or failed run must not leave a
+            # truncated WAV behind a matching key
+            meta_file.unlink(missing_ok=True)
+            self._log.info("Command: %s", " ".join(self._ltcgen_cmd))
             
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            returncode, _, stderr_tail = await self._run(self._ltcgen_cmd)
             
-            if result.returncode != 0:
-                print("❌ Error generating tone audio:")
-                print(result.stderr)
+            if returncode != 0:
+                self._log.error("❌ Error generating LTC audio:\n%s", stderr_tail)
                 return False
             
-            self.log(f"✓ Created tone audio: {self.tone_audio_file}")
+            meta_file.write_text(cache_key)
+            self.log(f"✓ Created LTC audio: {self.ltc_audio_file}")
             return True
         
         except Exception as e:
-            print(f"❌ Error: {e}")
+            self._log.error("❌ Error: %s", e)
             return False
     
-    def generate_test_video(self) -> bool:
+    async def generate_test_video(self) -> bool:
         """Generate test video with dual stereo audio
         
-        Left channel: 100 Hz reference tone
+        Left channel: 100 Hz reference tone (generated inline via lavfi)
         Right channel: LTC timecode audio
         
         Returns:
@@ -174,52 +317,35 @@ class TestSampleGenerator:
         self.log(f"Generating test video: {self.test_video_file}")
         
         try:
-            # Create video with merged audio (left=tone, right=ltc)
-            cmd = [
-                "ffmpeg",
-                "-f", "lavfi",
-                "-i", f"color=c=blue:s=320x240:d={self.duration}",
-                "-i", self.tone_audio_file,
-                "-i", self.ltc_audio_file,
-                "-filter_complex", "[1:a][2:a]amerge=inputs=2[a]",
-                "-map", "0:v",
-                "-map", "[a]",
-                "-c:v", "libx264",
-                "-preset", "fast",
-                "-c:a", "aac",
-                "-b:a", "128k",
-                "-shortest",
-                "-y",
-                self.test_video_file
-            ]
-            
-            if self.verbose:
-                print(f"Command: {' '.join(cmd)}")
+            self._log.info("Command: %s", " ".join(self._video_cmd))
             
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            returncode, _, stderr_tail = await self._run(self._video_cmd)
             
-            if result.returncode != 0:
-                print("❌ Error generating test video:")
-                print(result.stderr)
+            if returncode != 0:
+                self._log.error("❌ Error generating test video:\n%s", stderr_tail)
                 return False
             
             self.log(f"✓ Created test video: {self.test_video_file}")
             return True
         
         except Exception as e:
-            print(f"❌ Error: {e}")
+            self._log.error("❌ Error: %s", e)
             return False
     
     def cleanup_intermediate_files(self):
         """Remove intermediate files"""
-        intermediate_files = [self.ltc_audio_file, self.tone_audio_file]
+        intermediate_files = [self.ltc_audio_file, f"{self.ltc_audio_file}.meta"]
         
         for file in intermediate_files:
             if Path(file).exists():
                 Path(file).unlink()
                 self.log(f"Removed: {file}")
+        try:
+            self._scratch.rmdir()  # Only succeeds once nothing else is cached there
+        except OSError:
+            pass
     
-    def verify_output(self) -> bool:
+    async def verify_output(self) -> bool:
         """Verify the generated test video with ffprobe
         
         Returns:
@@ -228,23 +354,13 @@ class TestSampleGenerator:
         self.log("Verifying test video...")
         
         try:
-            # Simple verification - check if file has audio streams
-            cmd = [
-                "ffprobe",
-                "-v", "error",
-                "-select_streams", "a",
-                "-show_entries", "stream=channels",
-                "-of", "csv=p=0",
-                self.test_video_file
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            returncode, stdout, _ = await self._run(self._probe_cmd, capture_stdout=True)
             
-            if result.returncode != 0:
+            if returncode != 0:
                 self.log("⚠️  Warning: Could not verify audio channels")
                 return True  # Still succeed, file was created
             
-            output = result.stdout.strip()
+            output = stdout.strip()
             self.log(f"✓ Audio channels found: {output}")
             return True
         
@@ -252,9 +368,12 @@ class TestSampleGenerator:
             self.log(f"⚠️  Warning during verification: {e}")
             return True  # Still succeed, file was created
     
-    def generate(self, cleanup: bool = False) -> bool:
+    async def generate(self, cleanup: bool = False) -> bool:
         """Generate all test files
         
+        A <test video>.stamp file records the timecode and duration of the
+        last successful run; if it still matches, nothing is regenerated.
+        
         Args:
             cleanup: Whether to remove intermediate files
         
@@ -266,26 +385,36 @@ class TestSampleGenerator:
         print(f"   Duration: {self.duration}s")
         print(f"   Output: {self.output_prefix}_*\n")
         
+        # Skip everything if the test video was already built with these settings
+        stamp_file = Path(f"{self.test_video_file}.stamp")
+        stamp = f"{self.timecode}|{self.duration}"
+        if Path(self.test_video_file).exists() and stamp_file.exists() and stamp_file.read_text() == stamp:
+            self.log(f"✓ Test video cache hit: {self.test_video_file}")
+            print(f"✅ {self.test_video_file} is up to date, nothing to do\n")
+            return True
+        
+        # Invalidate first: a failed or interrupted rebuild can leave a
+        # partial video (-y), which a stale matching stamp would then bless
+        stamp_file.unlink(missing_ok=True)
+        
         # Check requirements
         if not self.check_requirements():
             return False
         
         # Generate LTC audio
-        if not self.generate_ltc_audio():
-            return False
-        
-        # Generate tone audio
-        if not self.generate_tone_audio():
+        if not await self.generate_ltc_audio():
             return False
         
         # Generate test video
-        if not self.generate_test_video():
+        if not await self.generate_test_video():
             return False
         
         # Verify output
-        if not self.verify_output():
+        if not await self.verify_output():
             print("⚠️  Warning: Verification failed, but files may still be usable")
         
+        stamp_file.write_text(stamp)
+        
         # Cleanup intermediate files
         if cleanup:
             self.cleanup_intermediate_files()
@@ -297,13 +426,12 @@ class TestSampleGenerator:
         
         if not cleanup:
             print(f"  • {self.ltc_audio_file} (LTC audio)")
-            print(f"  • {self.tone_audio_file} (Tone audio)")
         
         print("\nNext steps:")
         print("  1. Test the converter:")
         print(f"     python3 ltc_to_smpte.py {self.test_video_file}")
         print("\n  2. Verify the output:")
-        print("     ffprobe -show_entries stream_tags=timecode output.mp4")
+        print(f"     ffprobe -show_entries stream_tags=timecode {self.output_prefix}_with_ltc_tc.mov")
         print()
         
         return True
@@ -364,10 +492,10 @@ Examples:
     args = parser.parse_args()
     
     # Validate timecode format
-    timecode_parts = args.timecode.split(":")
-    if len(timecode_parts) != 4:
+    match = TIMECODE_RE.match(args.timecode)
+    if not match or int(match.group(1)) > 23 or int(match.group(4)) >= LTCGEN_FPS:
         print(f"❌ Error: Invalid timecode format '{args.timecode}'")
-        print("   Expected: HH:MM:SS:FF (e.g., 01:23:45:12)")
+        print(f"   Expected: HH:MM:SS:FF with HH < 24 and FF < {LTCGEN_FPS} (e.g., 01:23:45:12)")
         sys.exit(1)
     
     # Validate duration
@@ -383,7 +511,7 @@ Examples:
         verbose=args.verbose
     )
     
-    if generator.generate(cleanup=args.cleanup):
+    if asyncio.run(generator.generate(cleanup=args.cleanup)):
         sys.exit(0)
     else:
         sys.exit(1)
@@ -15,18 +15,79 @@ Requirements:
     - ffmpeg
     - numpy
     - ltctools (for LTC decoding)
+    - numba (optional, JIT-compiles the fallback decoder's offset search)
 """
 
 import argparse
+import functools
 import subprocess
 import sys
 import tempfile
+import threading
 import os
 import wave
 import shutil
+import struct
 import numpy as np
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Callable, Tuple, Optional
+
+# Optional JIT for the LTC bit-offset search
+_NUMBA_AVAILABLE = False
+try:  # pragma: no cover - optional dependency
+    from numba import njit, prange  # type: ignore
+    _NUMBA_AVAILABLE = True
+except Exception:  # pragma: no cover
+    _NUMBA_AVAILABLE = False
+
+
+if _NUMBA_AVAILABLE:
+    @njit(parallel=True, nogil=True, cache=True)
+    def _sync_counts_by_offset(audio, bit_length, sync_words):  # pragma: no cover - JIT compiled
+        """Count sync words found when bit windows start at each sample offset.
+        
+        Scalar equivalent of LTCDecoder._extract_bits_from_audio followed by
+        _find_frame_starts, run for all offsets in parallel.
+        """
+        counts = np.zeros(bit_length, dtype=np.int64)
+        for offset in prange(bit_length):
+            n_bits = (len(audio) - offset) // bit_length
+            word = 0
+            count = 0
+            for b in range(n_bits):
+                start = offset + b * bit_length
+                negative = audio[start] < 0
+                bit = 0
+                for k in range(1, bit_length):
+                    if (audio[start + k] < 0) != negative:
+                        bit = 1
+                        break
+                # Shift in from the top so the first bit ends up least significant
+                word = (word >> 1) | (bit << 15)
+                # Only count sync words preceded by a complete 64-bit frame body
+                if b >= 79:
+                    for sync in sync_words:
+                        if word == sync:
+                            count += 1
+            counts[offset] = count
+        return counts
+
+
+@functools.lru_cache(maxsize=None)
+def _bit_window_bounds(bit_length: int, max_samples: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    First and last sample index of every bit window for every sample offset
+    within one bit, as (bit_length, n_bits) arrays.
+    
+    They depend only on the sample rate, so they are built once per rate and
+    shared (read-only) by every decoder using it.
+    """
+    n_bits = (max_samples - bit_length + 1) // bit_length
+    first = np.arange(bit_length)[:, None] + np.arange(n_bits) * bit_length
+    last = first + (bit_length - 1)
+    first.setflags(write=False)
+    last.setflags(write=False)
+    return first, last
 
 
 class LTCDecoder:
@@ -45,10 +106,23 @@ class LTCDecoder:
     
     # LTC sync word patterns
     SYNC_WORDS = {0x3FFC, 0xBFFD, 0x3FFD, 0xBFFC}
+    SYNC_WORD_VALUES = np.array(sorted(SYNC_WORDS), dtype=np.uint16)
+    
+    # Only this much audio from the start is decoded (~18 frames); the
+    # timecode is taken from the first valid frame anyway
+    DECODE_SECONDS = 0.75
+    
+    # SMPTE 12M bit offsets and widths of the BCD digits within the first 64
+    # frame bits: frame, second, minute and hour units/tens
+    BCD_SHIFTS = np.array([0, 8, 16, 24, 32, 40, 48, 56], dtype=np.uint64)
+    BCD_MASKS = np.array([0xF, 0x3, 0xF, 0x7, 0xF, 0x7, 0xF, 0x3], dtype=np.uint64)
+    DROP_FRAME_BIT = 10
     
     def __init__(self, sample_rate: int = 48000):
         self.sample_rate = sample_rate
         self.bit_length = sample_rate // 1920  # 25 samples per bit at 48kHz
+        self.max_samples = int(self.DECODE_SECONDS * sample_rate)
+        self._window_first, self._window_last = _bit_window_bounds(self.bit_length, self.max_samples)
     
     def decode_ltc(self, audio_data: np.ndarray, wav_file: Optional[str] = None) -> Optional[Tuple[int, int, int, int, int]]:
         """
@@ -79,33 +153,51 @@ class LTCDecoder:
             return None
     
     def _decode_with_ltcdump(self, wav_file: str) -> Optional[Tuple[int, int, int, int, int]]:
-        """Decode using ltcdump tool from ltc-tools"""
+        """
+        Decode using ltcdump tool from ltc-tools.
+        
+        Output is parsed line by line as ltcdump produces it; ltcdump is
+        stopped at the first valid timecode instead of buffering its full output.
+        """
         try:
             # Run ltcdump on the WAV file, channel 1 (mono file extracted as channel 1)
             cmd = ["ltcdump", "-c", "1", "-F", wav_file]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False, timeout=10)
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            timed_out = threading.Event()
             
-            if result.returncode != 0:
-                return None
+            def kill():
+                timed_out.set()
+                proc.kill()
             
-            # Parse ltcdump output format: hh:mm:ss:ff
-            # Example output lines: "01:23:45:12  ..."
-            for line in result.stdout.split('\n'):
-                if ':' in line and 'Timecode' not in line and '#' not in line:
-                    parts = line.split()
-                    if parts:
-                        timecode = parts[1]  # Second column is the timecode
-                        try:
-                            h, m, s, f = timecode.split(':')
-                            hours = int(h)
-                            minutes = int(m)
-                            seconds = int(s)
-                            frames = int(f)
-                            print(f"✓ Decoded LTC using ltcdump: {hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d}")
-                            return (hours, minutes, seconds, frames, 0)
-                        except (ValueError, IndexError):
-                            continue
+            watchdog = threading.Timer(10, kill)
+            watchdog.start()
+            try:
+                # Parse ltcdump output format: hh:mm:ss:ff
+                # Example output lines: "01:23:45:12  ..."
+                for line in proc.stdout:
+                    if ':' in line and 'Timecode' not in line and '#' not in line:
+                        parts = line.split()
+                        if parts:
+                            try:
+                                timecode = parts[1]  # Second column is the timecode
+                                h, m, s, f = timecode.split(':')
+                                hours = int(h)
+                                minutes = int(m)
+                                seconds = int(s)
+                                frames = int(f)
+                                print(f"✓ Decoded LTC using ltcdump: {hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d}")
+                                return (hours, minutes, seconds, frames, 0)
+                            except (ValueError, IndexError):
+                                continue
+            finally:
+                watchdog.cancel()
+                if proc.poll() is None:
+                    proc.terminate()
+                proc.wait()
+                proc.stdout.close()
             
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(cmd, 10)
             return None
         except FileNotFoundError:
             print("Note: ltcdump not found, trying bit-level decoder", file=sys.stderr)
@@ -118,132 +210,140 @@ class LTCDecoder:
         """
         Decode LTC by analyzing bit transitions.
         Converts audio to binary representation and extracts timecode.
+        Only the first max_samples samples are examined. Zero-crossing
+        detection is scale-invariant, so samples are used as-is (int16 or
+        float) without conversion or normalization.
         """
-        # Normalize audio to [-1, 1] range
-        if audio_data.dtype == np.int16:
-            audio_normalized = audio_data.astype(np.float32) / 32768.0
-        elif audio_data.dtype == np.int32:
-            audio_normalized = audio_data.astype(np.float32) / 2147483648.0
-        else:
-            audio_normalized = audio_data.astype(np.float32)
-        
-        if audio_normalized.size == 0:
-            return (0, 0, 0, 0, 0)
-        
-        # Normalize to [-1, 1] range
-        max_val = np.max(np.abs(audio_normalized))
-        if max_val > 0:
-            audio_normalized = audio_normalized / max_val
+        audio = audio_data[:self.max_samples]
         
         # Calculate frame size in samples (one LTC frame = 80 bits)
         # LTC = 1920 bits per second, so at 48kHz: 48000/1920 = 25 samples per bit
         # One frame = 80 bits = 2000 samples at 48kHz
         samples_per_frame = self.sample_rate // 24  # Approximately 2000 at 48kHz
         
-        if len(audio_normalized) < samples_per_frame:
+        if len(audio) < samples_per_frame:
             return (0, 0, 0, 0, 0)
         
-        # Extract first complete frame
-        frame_audio = audio_normalized[:samples_per_frame]
+        # The first sample rarely falls on a bit boundary: try every sample
+        # offset within one bit and keep the one yielding the most sync words
+        if _NUMBA_AVAILABLE:
+            counts = _sync_counts_by_offset(np.asarray(audio), self.bit_length, self.SYNC_WORD_VALUES)
+            best_bits = self._extract_bits_from_audio(audio[int(np.argmax(counts)):])
+            best_starts = self._find_frame_starts(best_bits)
+        else:
+            best_bits, best_starts = None, None
+            for bits in self._extract_bits_at_offsets(audio):
+                starts = self._find_frame_starts(bits)
+                if best_starts is None or len(starts) > len(best_starts):
+                    best_bits, best_starts = bits, starts
         
-        # Decode bits using zero-crossing detection
-        bits = self._extract_bits_from_audio(frame_audio)
+        if len(best_starts):
+            frame_bits = best_bits[best_starts[:, None] + np.arange(80)]
+        else:
+            # No sync word anywhere; assume the audio starts on a frame boundary
+            bits = self._extract_bits_from_audio(audio)
+            frame_bits = bits[:len(bits) // 80 * 80].reshape(-1, 80)
         
-        if len(bits) < 80:
+        # Decode all LTC frames at once and report the first plausible one
+        timecodes, valid = self._decode_ltc_frames(frame_bits)
+        if not valid.any():
             return (0, 0, 0, 0, 0)
-        
-        # Decode the LTC frame
-        return self._decode_ltc_frame(bits[:80])
+        return tuple(timecodes[np.argmax(valid)].tolist())
     
-    def _extract_bits_from_audio(self, audio: np.ndarray) -> list:
+    def _extract_bits_from_audio(self, audio: np.ndarray) -> np.ndarray:
         """
         Extract bit sequence from audio using transition detection.
         A bit is represented as a transition (change from positive to negative or vice versa).
+        
+        The audio is reshaped to (n_bits, samples_per_bit) so every bit window
+        is evaluated in a single vectorized pass. Returns a uint8 array with one
+        entry per complete bit window.
         """
-        # Calculate samples per bit
-        samples_per_bit = self.bit_length
+        n_bits = len(audio) // self.bit_length
+        windows = audio[:n_bits * self.bit_length].reshape(n_bits, self.bit_length)
+        signs = windows < 0
         
-        bits = []
-        for i in range(80):
-            start = i * samples_per_bit
-            end = min((i + 1) * samples_per_bit, len(audio))
-            
-            if end - start < 2:
-                bits.append(0)
-                continue
-            
-            bit_audio = audio[start:end]
-            
-            # Detect zero crossing (transition)
-            sign_changes = np.where(np.diff(np.sign(bit_audio)))[0]
-            
-            # A bit is 1 if there's a zero crossing, 0 otherwise
-            bit_value = 1 if len(sign_changes) > 0 else 0
-            bits.append(bit_value)
+        # A bit is 1 if there's a zero crossing inside its window, 0 otherwise
+        transitions = (signs[:, 1:] ^ signs[:, :-1]).any(axis=1)
+        return transitions.astype(np.uint8)
+    
+    def _extract_bits_at_offsets(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Extract the bit sequence for every sample offset within one bit.
         
-        return bits
+        Row k matches _extract_bits_from_audio(audio[k:max_samples]), truncated
+        to a length common to all offsets. Sign changes and their running count
+        are computed once for the whole buffer; each bit window then only needs
+        two lookups into that count, at indices precomputed for this sample rate.
+        """
+        audio = audio[:self.max_samples]
+        n_bits = (len(audio) - self.bit_length + 1) // self.bit_length
+        signs = audio < 0
+        crossings = np.concatenate(([0], np.cumsum(signs[1:] ^ signs[:-1])))
+        first = self._window_first[:, :n_bits]
+        last = self._window_last[:, :n_bits]
+        return (crossings[last] > crossings[first]).astype(np.uint8)
     
-    def _decode_ltc_frame(self, bits: list) -> Tuple[int, int, int, int, int]:
+    def _find_frame_starts(self, bits: np.ndarray) -> np.ndarray:
         """
-        Decode an 80-bit LTC frame into timecode.
+        Return the bit indices at which complete frames start.
         
-        LTC Frame Structure (80 bits):
-        - Bits 0-3: Frame units (BCD)
-        - Bits 4-7: Frame tens (BCD)
-        - Bits 8-9: Drop frame & color frame flags
-        - Bits 10-13: Seconds units (BCD)
-        - Bits 14-17: Seconds tens (BCD)
-        - Bits 18-19: Flags
-        - Bits 20-23: Minutes units (BCD)
-        - Bits 24-27: Minutes tens (BCD)
-        - Bits 28-29: Flags
-        - Bits 30-33: Hours units (BCD)
-        - Bits 34-35: Hours tens (BCD)
-        - Bits 36-43: Binary group 1-4
-        - Bits 44-57: Binary group 5-8
-        - Bits 58-63: Binary group 9-11
-        - Bits 64-79: Sync word (should be 0x3FFC or 0xBFFD)
+        Every 16-bit window is packed into a uint16 (first bit least
+        significant) and compared against SYNC_WORDS in one pass; a frame
+        starts 64 bits before each sync word.
         """
         if len(bits) < 80:
-            return (0, 0, 0, 0, 0)
-        
-        try:
-            # Extract BCD encoded values
-            frames_units = self._bcd_decode(bits[0:4])
-            frames_tens = self._bcd_decode(bits[4:8])
-            frames = frames_tens * 10 + frames_units
-            
-            seconds_units = self._bcd_decode(bits[10:14])
-            seconds_tens = self._bcd_decode(bits[14:18])
-            seconds = seconds_tens * 10 + seconds_units
-            
-            minutes_units = self._bcd_decode(bits[20:24])
-            minutes_tens = self._bcd_decode(bits[24:28])
-            minutes = minutes_tens * 10 + minutes_units
-            
-            hours_units = self._bcd_decode(bits[30:34])
-            hours_tens = self._bcd_decode(bits[34:36])
-            hours = hours_tens * 10 + hours_units
-            
-            # Drop frame flag
-            drop_frame = bits[8]
-            
-            # Validate ranges
-            if hours > 23 or minutes > 59 or seconds > 59 or frames > 59:
-                return (0, 0, 0, 0, 0)
-            
-            return (hours, minutes, seconds, frames, drop_frame)
-        except Exception:
-            return (0, 0, 0, 0, 0)
+            return np.empty(0, dtype=np.intp)
+        windows = np.lib.stride_tricks.sliding_window_view(bits, 16)
+        words = np.packbits(windows, axis=1, bitorder='little').view('<u2')[:, 0]
+        sync_positions = np.flatnonzero(np.isin(words, self.SYNC_WORD_VALUES))
+        return sync_positions[sync_positions >= 64] - 64
     
-    def _bcd_decode(self, bits: list) -> int:
-        """Decode 4 bits as BCD (Binary Coded Decimal)"""
-        if len(bits) < 4:
-            return 0
-        value = 0
-        for i, bit in enumerate(bits[:4]):
-            value += bit * (2 ** (3 - i))
-        return value
+    def _decode_ltc_frames(self, bits: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decode a batch of 80-bit LTC frames into timecodes.
+        
+        LTC Frame Structure (SMPTE 12M, 80 bits, BCD digits least significant
+        bit first; each digit is followed by a 4-bit binary (user bits) group):
+        - Bits 0-3: Frame units (BCD)
+        - Bits 8-9: Frame tens (BCD)
+        - Bits 10-11: Drop frame & color frame flags
+        - Bits 16-19: Seconds units (BCD)
+        - Bits 24-26: Seconds tens (BCD)
+        - Bit 27: Flag (polarity correction / BGF0)
+        - Bits 32-35: Minutes units (BCD)
+        - Bits 40-42: Minutes tens (BCD)
+        - Bit 43: Flag (BGF)
+        - Bits 48-51: Hours units (BCD)
+        - Bits 56-57: Hours tens (BCD)
+        - Bits 58-59: Flags
+        - Bits 64-79: Sync word (0011 1111 1111 1101 as transmitted)
+        
+        Args:
+            bits: (n_frames, 80) array of frame bits
+        
+        Returns:
+            Tuple of ((n_frames, 5) array of (hours, minutes, seconds, frames,
+            drop_frame), (n_frames,) mask of frames whose fields are in range)
+        """
+        # Pack bits 0-63 of each frame into one little-endian uint64 (first bit
+        # least significant); the sync word was already matched when framing
+        body = np.packbits(bits[:, :64], axis=1, bitorder='little').view('<u8')[:, 0]
+        
+        # Every BCD digit of every frame is a shift and a mask away
+        digits = ((body[:, None] >> self.BCD_SHIFTS) & self.BCD_MASKS).astype(np.intp)
+        frames = digits[:, 1] * 10 + digits[:, 0]
+        seconds = digits[:, 3] * 10 + digits[:, 2]
+        minutes = digits[:, 5] * 10 + digits[:, 4]
+        hours = digits[:, 7] * 10 + digits[:, 6]
+        
+        # Drop frame flag
+        drop_frame = bits[:, self.DROP_FRAME_BIT].astype(np.intp)
+        
+        # Validate ranges
+        valid = (hours <= 23) & (minutes <= 59) & (seconds <= 59) & (frames <= 59)
+        
+        return np.stack([hours, minutes, seconds, frames, drop_frame], axis=1), valid
 
 
 class SMPTEWriter:
@@ -262,7 +362,8 @@ class SMPTEWriter:
         minutes: int,
         seconds: int,
         frames: int,
-        drop_frame: bool = False
+        drop_frame: bool = False,
+        mix_channels: bool = False
     ) -> bool:
         """
         Write SMPTE timecode to video file using ffmpeg.
@@ -272,14 +373,33 @@ class SMPTEWriter:
             output_file: Path to output video
             hours, minutes, seconds, frames: Timecode values
             drop_frame: Whether to use drop-frame timecode
+            mix_channels: Also replace the LTC channel with a copy of the
+                first channel (re-encodes the audio)
         
         Returns:
             True if successful, False otherwise
         """
         timecode = SMPTEWriter.format_timecode(hours, minutes, seconds, frames)
-        
-        # Use FFmpeg's -timecode option with copy codec to preserve original format
-        # -c:v copy and -c:a copy preserve the original video and audio codecs
+        if mix_channels:
+            return SMPTEWriter.write_timecode_and_mix(input_file, output_file, timecode)
+        return SMPTEWriter.write_timecode_only(input_file, output_file, timecode)
+    
+    @staticmethod
+    def write_timecode_only(input_file: str, output_file: str, timecode: str) -> bool:
+        """Write the timecode tag, stream-copying video and audio (remux only)"""
+        cmd = [
+            "ffmpeg",
+            "-i", input_file,
+            "-timecode", timecode,
+            "-c", "copy",  # Copy all streams without re-encoding
+            "-y",
+            output_file
+        ]
+        return SMPTEWriter._run_ffmpeg(cmd)
+    
+    @staticmethod
+    def write_timecode_and_mix(input_file: str, output_file: str, timecode: str) -> bool:
+        """Write the timecode tag and copy the first audio channel over the LTC channel"""
         cmd = [
             "ffmpeg",
             "-i", input_file,
@@ -290,7 +410,10 @@ class SMPTEWriter:
             "-y",
             output_file
         ]
-        
+        return SMPTEWriter._run_ffmpeg(cmd)
+    
+    @staticmethod
+    def _run_ffmpeg(cmd: list[str]) -> bool:
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, check=False)
             if result.returncode == 0:
@@ -315,12 +438,13 @@ class VideoProcessor:
         if not Path(self.input_file).exists():
             raise FileNotFoundError(f"Video file not found: {self.input_file}")
     
-    def extract_second_channel_audio(self, output_wav: str) -> bool:
+    def extract_second_channel_audio(self, output_wav: str, max_seconds: Optional[float] = None) -> bool:
         """
         Extract the second stereo channel as mono WAV file.
         
         Args:
             output_wav: Path to output WAV file
+            max_seconds: Only extract this much audio from the start
         
         Returns:
             True if successful, False otherwise
@@ -332,8 +456,10 @@ class VideoProcessor:
             "-q:a", "9",
             "-ac", "1",
             "-af", "pan=mono|c0=c1",  # Extract right channel (index 1)
-            output_wav
         ]
+        if max_seconds is not None:
+            cmd += ["-t", str(max_seconds)]
+        cmd.append(output_wav)
         
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, check=False)
@@ -347,10 +473,77 @@ class VideoProcessor:
             print(f"✗ Error extracting audio: {e}", file=sys.stderr)
             return False
     
+    def read_second_channel_pcm(self, sample_rate: int = 48000, max_seconds: Optional[float] = None) -> Tuple[int, np.ndarray]:
+        """
+        Decode the second stereo channel to mono 16-bit PCM in memory.
+        
+        ffmpeg writes raw samples to stdout, which are wrapped by numpy
+        without an intermediate WAV file. With max_seconds, only that many
+        samples are read and ffmpeg is stopped as soon as they arrive.
+        
+        Args:
+            sample_rate: Sample rate to resample to
+            max_seconds: Only extract this much audio from the start
+        
+        Returns:
+            Tuple of (sample_rate, audio_data)
+        """
+        cmd = [
+            "ffmpeg",
+            "-loglevel", "error",  # Keep stderr small; it is only read at the end
+            "-i", self.input_file,
+            "-map", "0:a",
+            "-ac", "1",
+            "-af", "pan=mono|c0=c1",  # Extract right channel (index 1)
+            "-f", "s16le",
+            "-ar", str(sample_rate),
+        ]
+        needed_bytes = -1
+        if max_seconds is not None:
+            cmd += ["-t", str(max_seconds)]
+            needed_bytes = int(max_seconds * sample_rate) * 2
+        cmd.append("-")
+        
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1 << 20)
+        try:
+            data = proc.stdout.read(needed_bytes)
+        finally:
+            if proc.poll() is None:
+                proc.terminate()
+            _, stderr = proc.communicate()
+        
+        # Terminating ffmpeg once enough samples arrived is not a failure
+        if proc.returncode != 0 and (needed_bytes < 0 or len(data) < needed_bytes):
+            raise RuntimeError(f"Failed to extract audio: {stderr.decode(errors='replace')}")
+        
+        audio_data = np.frombuffer(data, dtype='<i2')
+        print(f"✓ Extracted second audio channel: {sample_rate}Hz, {len(audio_data)} samples")
+        return sample_rate, audio_data
+    
+    @staticmethod
+    def _wav_data_offset(wav_file: str) -> int:
+        """Return the byte offset of the PCM payload in a RIFF/WAVE file"""
+        with open(wav_file, 'rb') as f:
+            riff, _, wave_id = struct.unpack('<4sI4s', f.read(12))
+            if riff != b'RIFF' or wave_id != b'WAVE':
+                raise ValueError(f"Not a RIFF/WAVE file: {wav_file}")
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    raise ValueError(f"No data chunk in WAV file: {wav_file}")
+                chunk_id, chunk_size = struct.unpack('<4sI', header)
+                if chunk_id == b'data':
+                    return f.tell()
+                # Chunks are padded to an even size
+                f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+    
     def read_wav_file(self, wav_file: str) -> Tuple[int, np.ndarray]:
         """
         Read WAV file and return sample rate and audio data.
         
+        The samples are memory-mapped rather than read, so only the pages the
+        decoder actually touches are loaded.
+        
         Returns:
             Tuple of (sample_rate, audio_data)
         """
@@ -360,9 +553,14 @@ class VideoProcessor:
                 frame_rate = wav.getframerate()
                 n_frames = wav.getnframes()
                 
-                # Read audio data
-                audio_bytes = wav.readframes(n_frames)
-                audio_data = np.frombuffer(audio_bytes, dtype=np.int16)
+                # Map audio data
+                audio_data = np.memmap(
+                    wav_file,
+                    dtype='<i2',
+                    mode='r',
+                    offset=self._wav_data_offset(wav_file),
+                    shape=(n_frames * n_channels,)
+                )
                 
                 if n_channels > 1:
                     audio_data = audio_data.reshape((-1, n_channels))
@@ -373,40 +571,56 @@ class VideoProcessor:
             print(f"✗ Error reading WAV file: {e}", file=sys.stderr)
             raise
     
-    def process(self, output_file: str) -> bool:
+    def process(self, output_file: str, mix_channels: bool = False,
+                progress: Optional[Callable[[float], None]] = None) -> bool:
         """
         Main processing pipeline: extract, decode, and write timecode.
         
         Args:
             output_file: Path to output video with SMPTE timecode
+            mix_channels: Replace the LTC channel with the first channel in
+                the output (re-encodes the audio)
+            progress: Called with the completed fraction (0-1) after each step
         
         Returns:
             True if successful, False otherwise
         """
         with tempfile.TemporaryDirectory() as tmpdir:
-            # Step 1: Extract second channel audio
-            wav_file = os.path.join(tmpdir, "second_channel.wav")
-            if not self.extract_second_channel_audio(wav_file):
-                return False
-            
-            # Step 2: Read WAV file
+            # Step 1+2: Extract second channel audio and load it. ltcdump needs
+            # a WAV file; the internal decoder takes raw PCM straight from ffmpeg.
+            # ltcdump gets the whole clip so LTC after a pre-roll is still found;
+            # only the fallback decoder is capped at DECODE_SECONDS.
+            wav_file = None
             try:
-                sample_rate, audio_data = self.read_wav_file(wav_file)
+                if _which("ltcdump"):
+                    wav_file = os.path.join(tmpdir, "second_channel.wav")
+                    if not self.extract_second_channel_audio(wav_file):
+                        return False
+                    sample_rate, audio_data = self.read_wav_file(wav_file)
+                else:
+                    sample_rate, audio_data = self.read_second_channel_pcm(max_seconds=LTCDecoder.DECODE_SECONDS)
             except Exception as e:
                 print(f"✗ Failed to read audio: {e}", file=sys.stderr)
                 return False
+            if progress:
+                progress(1 / 3)
             
             # Step 3: Decode LTC
             decoder = LTCDecoder(sample_rate=sample_rate)
             print("🔄 Decoding LTC timecode...")
             timecode = decoder.decode_ltc(audio_data, wav_file=wav_file)
             
+            # Drop the memory map so the temporary WAV can be deleted (Windows)
+            del audio_data
+            
             if timecode:
                 hours, minutes, seconds, frames, frame_rate_flag = timecode
                 print(f"✓ Decoded timecode: {hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d}")
             else:
                 print("✗ Failed to decode LTC timecode, using default 00:00:00:00")
                 hours, minutes, seconds, frames = 0, 0, 0, 0
+            if progress:
+                progress(2 / 3)
             
             # Step 4: Write SMPTE timecode to video
             print("🔄 Writing SMPTE timecode to video...")
@@ -416,33 +630,58 @@ class VideoProcessor:
                 hours,
                 minutes,
                 seconds,
-                frames
+                frames,
+                mix_channels=mix_channels
             ):
                 print(f"✓ Successfully created output video: {output_file}")
+                if progress:
+                    progress(1.0)
                 return True
             else:
                 print("✗ Failed to write SMPTE timecode to video", file=sys.stderr)
                 return False
 
+# Tool name -> absolute path; only successful lookups are remembered
+_TOOL_PATHS: dict[str, str] = {}
+
+def _which(tool: str) -> Optional[str]:
+    """shutil.which, memoized for the process lifetime once the tool is found.
+
+    A miss is not cached, so a tool installed while a long-running caller
+    (the GUI worker) is up is picked up by the next lookup.
+    """
+    path = _TOOL_PATHS.get(tool)
+    if path is None:
+        path = shutil.which(tool)
+        if path is not None:
+            _TOOL_PATHS[tool] = path
+    return path
+
+@functools.lru_cache(maxsize=None)
 def check_prerequisites(require_ltcdump: bool = False):
     """Check if required external tools are available.
 
     ffmpeg is required. ltcdump is optional (fallback decoder used if missing).
     If require_ltcdump is True we will exit if ltcdump is unavailable.
+    Only the first call per argument does any work; batch callers pay once.
     """
-    if not shutil.which("ffmpeg"):
+    if not _which("ffmpeg"):
         print("✗ Required tool 'ffmpeg' not found in PATH.", file=sys.stderr)
         sys.exit(1)
-    if require_ltcdump and not shutil.which("ltcdump"):
+    if require_ltcdump and not _which("ltcdump"):
         print("✗ Required tool 'ltcdump' not found in PATH (set require_ltcdump=False to allow fallback).", file=sys.stderr)
         sys.exit(1)
-    if not shutil.which("ltcdump"):
+    if not _which("ltcdump"):
         print("Note: 'ltcdump' not found – will use internal fallback decoder.")
 
-def process_video(input_path: str, output_path: Optional[str] = None, verbose: bool = False) -> bool:
+def process_video(input_path: str, output_path: Optional[str] = None, verbose: bool = False,
+                  mix_channels: bool = False, progress: Optional[Callable[[float], None]] = None) -> bool:
     """Convenience wrapper for GUI/CLI to process a single video.
 
     If output_path is None, create one by inserting '_tc' before the extension.
+    By default streams are copied untouched; mix_channels re-encodes the audio
+    with the LTC channel replaced by the first channel. progress, if given,
+    receives the completed fraction (0-1) after each pipeline step.
     Returns True on success, False otherwise.
     """
     check_prerequisites(require_ltcdump=False)
@@ -451,7 +690,7 @@ def process_video(input_path: str, output_path: Optional[str] = None, verbose: b
         output_path = str(p.with_name(p.stem + '_tc' + p.suffix))
     try:
         processor = VideoProcessor(input_path)
-        success = processor.process(output_path)
+        success = processor.process(output_path, mix_channels=mix_channels, progress=progress)
         return success
     except Exception as e:
         print(f"✗ Error processing video: {e}", file=sys.stderr)
@@ -460,6 +699,7 @@ def process_video(input_path: str, output_path: Optional[str] = None, verbose: b
             traceback.print_exc()
         return False
 
+@functools.lru_cache(maxsize=1)
 def _gather_tool_info() -> str:
     """Return a multi-line string describing discovered external tool binaries.
 
@@ -467,7 +707,7 @@ def _gather_tool_info() -> str:
     """
     lines: list[str] = ["External tools detected:"]
     # ffmpeg
-    ffmpeg_path = shutil.which("ffmpeg")
+    ffmpeg_path = _which("ffmpeg")
     if ffmpeg_path:
         try:
             r = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True, timeout=5)
@@ -478,7 +718,7 @@ def _gather_tool_info() -> str:
     else:
         lines.append("  ffmpeg: NOT FOUND in PATH")
     # ltcdump (optional)
-    ltcdump_path = shutil.which("ltcdump")
+    ltcdump_path = _which("ltcdump")
     if ltcdump_path:
         try:
             # ltcdump does not have a --version flag; capture first line of help output
@@ -511,8 +751,13 @@ def main():
         action="store_true",
         help="Enable verbose output"
     )
+    parser.add_argument(
+        "--mix-channels",
+        action="store_true",
+        help="Replace the LTC channel with a copy of the first audio channel (re-encodes audio to AAC)"
+    )
     args = parser.parse_args()
-    success = process_video(args.input_file, args.output, verbose=args.verbose)
+    success = process_video(args.input_file, args.output, verbose=args.verbose, mix_channels=args.mix_channels)
     sys.exit(0 if success else 1)
 
 
@@ -6,7 +6,7 @@ Expected prior steps:
 
 This script:
   * Detects platform/arch
-  * Copies executables from dist/ into a staging directory
+  * Streams executables from dist/ straight into the archive, hashing them on the way
   * Generates CHECKSUMS.txt (SHA256)
   * Creates README_DISTRIBUTION.md subset of main README
   * Zips everything to ltc_to_smpte_<platform>_<arch>.zip
@@ -18,46 +18,62 @@ into the archive under `ffmpeg/` with a minimal NOTICE.
 from __future__ import annotations
 import hashlib
 import platform
+import re
 import shutil
 import sys
+import time
 import zipfile
 import os
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 DIST = ROOT / "dist"
-BUILD = ROOT / "build_dist"
 README = ROOT / "README.md"
 LICENSE = ROOT / "LICENSE"
 
 GUI_NAME = "timecode_gui"
+COPY_BLOCK_SIZE = 1 << 20
+# Keep only top + prerequisites + usage + GUI Usage
+KEEP_SECTIONS_RE = re.compile(r"# LTC to SMPTE Converter|## Prerequisites|## Usage|## GUI Usage")
 
-def sha256_file(path: Path) -> str:
+def add_file_hashed(z: zipfile.ZipFile, src: Path, arcname: str) -> str:
+    """Stream src into the archive uncompressed and return its SHA256.
+
+    The file is read once; each block feeds both the hash and the zip entry.
+    Executables are already compressed, so they are stored rather than deflated.
+    """
     h = hashlib.sha256()
-    with path.open('rb') as f:
-        for chunk in iter(lambda: f.read(65536), b''):
+    info = zipfile.ZipInfo.from_file(src, arcname)  # keeps mtime and exec bits
+    info.compress_type = zipfile.ZIP_STORED
+    with src.open('rb') as f, z.open(info, 'w', force_zip64=True) as dst:
+        while chunk := f.read(COPY_BLOCK_SIZE):
             h.update(chunk)
+            dst.write(chunk)
     return h.hexdigest()
 
-def make_subset_readme(out: Path):
+def add_text(z: zipfile.ZipFile, arcname: str, text: str) -> str:
+    """Write generated text into the archive (deflated) and return its SHA256."""
+    data = text.encode('utf-8')
+    info = zipfile.ZipInfo(arcname, time.localtime()[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o100644 << 16  # regular file, rw-r--r--
+    z.writestr(info, data)
+    return hashlib.sha256(data).hexdigest()
+
+def make_subset_readme() -> str:
     if not README.exists():
-        out.write_text("LTC to SMPTE Tool\n", encoding='utf-8')
-        return
+        return "LTC to SMPTE Tool\n"
     text = README.read_text(encoding='utf-8')
-    # Keep only top + prerequisites + usage + GUI Usage
-    keep_sections = ["# LTC to SMPTE Converter", "## Prerequisites", "## Usage", "## GUI Usage"]
     lines = text.splitlines()
     kept: list[str] = []
     capture = False
-    current_header = None
     for line in lines:
         if line.startswith('#'):
-            current_header = line.strip()
-            capture = any(current_header.startswith(sec) for sec in keep_sections)
+            capture = KEEP_SECTIONS_RE.match(line.strip()) is not None
         if capture:
             kept.append(line)
     kept.append("\n---\nFull documentation: See repository README.md online.\n")
-    out.write_text("\n".join(kept), encoding='utf-8')
+    return "\n".join(kept)
 
 def main():
     if not DIST.exists():
@@ -70,57 +86,22 @@ def main():
         print("Required executables not found in dist/", file=sys.stderr)
         sys.exit(1)
 
-    if BUILD.exists():
-        shutil.rmtree(BUILD)
-    BUILD.mkdir(parents=True)
-
-    # Copy binaries
-    shutil.copy2(gui_exec, BUILD / gui_exec.name)
-
-    # Copy license
-    if LICENSE.exists():
-        shutil.copy2(LICENSE, BUILD / LICENSE.name)
-
-    # Generate subset README
-    subset = BUILD / "README_DISTRIBUTION.md"
-    make_subset_readme(subset)
-
-    # Checksums
-    checksums_path = BUILD / "CHECKSUMS.txt"
-    with checksums_path.open('w', encoding='utf-8') as f:
-        for artifact in [gui_exec.name]:
-            digest = sha256_file(BUILD / artifact)
-            f.write(f"{digest}  {artifact}\n")
+    # Binaries to ship as (source, name in archive)
+    binaries: list[tuple[Path, str]] = [(gui_exec, gui_exec.name)]
 
     # Optional ffmpeg bundling
-    if os.environ.get("BUNDLE_FFMPEG") == "1":
-        ffmpeg_dir = BUILD / "ffmpeg"
-        ffmpeg_dir.mkdir(exist_ok=True)
+    bundle_ffmpeg = os.environ.get("BUNDLE_FFMPEG") == "1"
+    if bundle_ffmpeg:
         bundle_src = ROOT / "ffmpeg_bundle"
-        copied: list[str] = []
         if bundle_src.exists():
             for item in bundle_src.iterdir():
                 if item.is_file() and (item.name.startswith("ffmpeg") or item.name.startswith("ffprobe")):
-                    shutil.copy2(item, ffmpeg_dir / item.name)
-                    copied.append(item.name)
+                    binaries.append((item, f"ffmpeg/{item.name}"))
         else:
             for bin_name in ["ffmpeg", "ffprobe"]:
                 path = shutil.which(bin_name)
                 if path:
-                    shutil.copy2(path, ffmpeg_dir / bin_name)
-                    copied.append(bin_name)
-        notice = ffmpeg_dir / "NOTICE.txt"
-        notice.write_text(
-            "This distribution includes ffmpeg binaries for user convenience.\n"
-            "ffmpeg is licensed under LGPL/GPL depending on build configuration.\n"
-            "Project: https://ffmpeg.org | Legal: https://ffmpeg.org/legal.html\n"
-            f"Included files: {', '.join(copied) if copied else 'NONE'}\n",
-            encoding="utf-8"
-        )
-        with checksums_path.open('a', encoding='utf-8') as f:
-            for item in copied + ["NOTICE.txt"]:
-                digest = sha256_file(ffmpeg_dir / item)
-                f.write(f"{digest}  ffmpeg/{item}\n")
+                    binaries.append((Path(path), f"ffmpeg/{bin_name}"))
 
     plat = platform.system().lower()
     arch = platform.machine().lower()
@@ -129,13 +110,33 @@ def main():
     if zip_path.exists():
         zip_path.unlink()
 
+    checksums: list[str] = []
     with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as z:
-        for p in BUILD.iterdir():
-            if p.is_dir():
-                for sub in p.rglob('*'):
-                    z.write(sub, sub.relative_to(BUILD).as_posix())
-            else:
-                z.write(p, p.name)
+        # Copy binaries, hashing them in the same pass
+        for src, arcname in binaries:
+            digest = add_file_hashed(z, src, arcname)
+            checksums.append(f"{digest}  {arcname}\n")
+
+        if bundle_ffmpeg:
+            copied = [arcname.removeprefix("ffmpeg/") for _, arcname in binaries[1:]]
+            notice = (
+                "This distribution includes ffmpeg binaries for user convenience.\n"
+                "ffmpeg is licensed under LGPL/GPL depending on build configuration.\n"
+                "Project: https://ffmpeg.org | Legal: https://ffmpeg.org/legal.html\n"
+                f"Included files: {', '.join(copied) if copied else 'NONE'}\n"
+            )
+            digest = add_text(z, "ffmpeg/NOTICE.txt", notice)
+            checksums.append(f"{digest}  ffmpeg/NOTICE.txt\n")
+
+        # Copy license
+        if LICENSE.exists():
+            z.write(LICENSE, LICENSE.name)
+
+        # Generate subset README
+        add_text(z, "README_DISTRIBUTION.md", make_subset_readme())
+
+        # Checksums
+        add_text(z, "CHECKSUMS.txt", "".join(checksums))
 
     print(f"Created artifact: {zip_path}")
 
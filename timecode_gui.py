@@ -11,7 +11,8 @@ Features:
 - Drag & drop a video file (if tkinterdnd2 available) OR use "Select File" button.
 - Automatically generates output filename with _tc suffix (e.g. clip.mp4 -> clip_tc.mp4).
 - Displays log/progress messages.
-- Runs processing in a background thread to keep UI responsive.
+- Runs processing in a background worker thread to keep UI responsive; files
+  submitted while busy are queued.
 
 Dependencies: only standard library + numpy (already used by backend). Optional: tkinterdnd2.
 
@@ -22,8 +23,12 @@ On macOS you may need: `pip install tkinterdnd2` for native drag & drop.
 If tkinterdnd2 is not installed, drag & drop is disabled but selection button works.
 """
 from __future__ import annotations
-import threading
+import codecs
+import os
 import queue
+import selectors
+import subprocess
+import threading
 import sys
 from pathlib import Path
 from ltc_to_smpte import process_video  # type: ignore
@@ -40,6 +45,8 @@ _DND_AVAILABLE = False
 try:  # pragma: no cover - optional dependency
     from tkinterdnd2 import DND_FILES, TkinterDnD  # type: ignore
     _DND_AVAILABLE = True
+    # Resolved once here instead of probed with hasattr at window creation
+    _DND_TK = getattr(TkinterDnD, 'Tk', None)
 except Exception:  # pragma: no cover
     # Provide simple fallbacks so name references exist (type hints only)
     class _Dummy:  # noqa: D401
@@ -48,21 +55,271 @@ except Exception:  # pragma: no cover
     DND_FILES = "DND_FALLBACK"  # type: ignore
     TkinterDnD = _Dummy  # type: ignore
     _DND_AVAILABLE = False
+    _DND_TK = None
+
+_FILETYPES = (
+    ("Video Files", "*.mp4 *.mov *.mxf *.mkv *.avi"),
+    ("All Files", "*.*"),
+)
+
+# Command that opens a folder in the platform's file manager
+if sys.platform == 'darwin':
+    _OPEN_FOLDER_CMD = ('open', '--')
+elif sys.platform.startswith('win'):
+    _OPEN_FOLDER_CMD = ('explorer',)
+else:  # linux
+    _OPEN_FOLDER_CMD = ('xdg-open',)
+
+
+class RingLog:
+    """Single-producer/single-consumer ring buffer of log lines.
+
+    ``put`` and ``drain`` only do plain int and list-slot stores, which are
+    atomic under the GIL, so neither side takes a lock or allocates a node per
+    message. If the producer laps the consumer the oldest unread lines are
+    overwritten.
+
+    The ring is only safe with exactly one producer thread at a time. In the
+    GUI that is the worker thread (or, while output is being captured, the
+    capture reader it hands over to); the Tk main thread only drains, woken
+    by its own ``after`` poll rather than by the producer.
+
+    If ``wake_fd`` is set, ``put`` also writes a byte to it whenever the
+    consumer may be waiting, so the consumer can sleep on the other end of a
+    pipe. At most one byte is outstanding per drain.
+    """
+    __slots__ = ('buf', 'mask', 'head', 'tail', 'wake_fd', 'wake_pending')
+
+    def __init__(self, capacity: int = 1024):
+        if capacity & (capacity - 1):
+            raise ValueError("RingLog capacity must be a power of two")
+        self.buf: list[str | None] = [None] * capacity
+        self.mask = capacity - 1
+        self.head = 0  # next slot to read, only advanced by the consumer
+        self.tail = 0  # next slot to write, only advanced by the producer
+        self.wake_fd: int | None = None
+        self.wake_pending = False
+
+    def put(self, item: str):
+        t = self.tail
+        self.buf[t & self.mask] = item
+        self.tail = t + 1
+        # Set after tail: a consumer that cleared the flag reads the new tail
+        if self.wake_fd is not None and not self.wake_pending:
+            self.wake_pending = True
+            try:
+                os.write(self.wake_fd, b'\0')
+            except BlockingIOError:
+                pass
+
+    def drain(self, limit: int | None = None) -> list[str]:
+        self.wake_pending = False  # cleared before reading tail
+        tail = self.tail
+        # Skip whatever the producer has already overwritten
+        head = max(self.head, tail - self.mask - 1)
+        if limit is not None:
+            tail = min(tail, head + limit)
+        items = [self.buf[i & self.mask] for i in range(head, tail)]
+        self.head = tail
+        return items  # type: ignore[return-value]
+
+
+class QueueStream:
+    """File-like object splitting written text into tagged lines for a RingLog."""
+
+    def __init__(self, q: RingLog, tag: str):
+        self.q = q
+        self.tag = tag
+        self._parts: list[str] = []  # pieces of the current unfinished line
+
+    def write(self, data: str):  # pragma: no cover - simple passthrough
+        if not data:
+            return
+        self._parts.append(data)
+        if '\n' not in data:
+            return
+        # Join once per newline-bearing write instead of growing a string
+        lines = ''.join(self._parts).split('\n')
+        self._parts = [lines.pop()]
+        for line in lines:
+            line = line.rstrip('\r')
+            if line and not line.isspace():
+                self.q.put(f"{self.tag} {line}")
+
+    def flush(self):  # pragma: no cover - not used
+        pass
+
+
+class StreamCapture:
+    """Capture Python-level writes by swapping sys.stdout/sys.stderr.
+
+    Fallback for platforms (or windowed builds) where file descriptors 1 and 2
+    cannot be redirected. Reusable: the same streams serve every capture.
+    """
+
+    def __init__(self, q: RingLog):
+        self.q = q
+        self._streams = (QueueStream(q, "[stdout]"), QueueStream(q, "[stderr]"))
+
+    def __enter__(self):
+        self._orig = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = self._streams  # type: ignore
+        return self
+
+    def __exit__(self, *exc):
+        sys.stdout, sys.stderr = self._orig
+        # Emit any unterminated last line so the next capture starts clean
+        for stream in self._streams:
+            stream.write('\n')
+        return False
+
+
+class FdCapture:
+    """Capture everything written to file descriptors 1 and 2.
+
+    Both descriptors are pointed at OS pipes, so output from C extensions and
+    inherited child processes is captured along with Python-level writes. A
+    single reader thread serves both pipes and is the ring's only producer
+    while the capture is active. Reusable: a new pair of pipes is set up on
+    every entry, the line splitters and decoders are kept.
+    """
+
+    TAGS = {1: "[stdout]", 2: "[stderr]"}
+    # How long to wait for EOF after restoring fds 1/2. A child process that
+    # inherited the pipes' write ends keeps them open past the job.
+    DRAIN_TIMEOUT = 2.0
+
+    @staticmethod
+    def available() -> bool:
+        if os.name != 'posix':
+            return False
+        try:
+            os.fstat(1)
+            os.fstat(2)
+        except OSError:
+            return False
+        return True
+
+    def __init__(self, q: RingLog):
+        self.q = q
+        self._splitters = {
+            fd: (QueueStream(q, tag), codecs.getincrementaldecoder('utf-8')(errors='replace'))
+            for fd, tag in self.TAGS.items()
+        }
+
+    def __enter__(self):
+        self._flush_std_streams()
+        self._saved: dict[int, int] = {}
+        self._readers: dict[int, int] = {}
+        for fd in self.TAGS:
+            r, w = os.pipe()
+            self._saved[fd] = os.dup(fd)
+            os.dup2(w, fd)
+            os.close(w)
+            self._readers[r] = fd
+        self._stop_r, self._stop_w = os.pipe()
+        # Forward Python prints line by line rather than when the buffer fills
+        self._line_buffering = {}
+        for stream in (sys.stdout, sys.stderr):
+            if stream is not None and hasattr(stream, 'reconfigure'):
+                self._line_buffering[stream] = stream.line_buffering
+                stream.reconfigure(line_buffering=True)
+        self._thread = threading.Thread(target=self._pump, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._flush_std_streams()
+        for stream, line_buffering in self._line_buffering.items():
+            stream.reconfigure(line_buffering=line_buffering)
+        # Restoring the descriptors closes the pipes' last write ends, so the
+        # reader sees EOF once it has forwarded everything
+        for fd, saved in self._saved.items():
+            os.dup2(saved, fd)
+            os.close(saved)
+        self._thread.join(self.DRAIN_TIMEOUT)
+        if self._thread.is_alive():
+            # Some child still holds a write end: stop reading without EOF
+            os.write(self._stop_w, b'\0')
+            self._thread.join()
+        for r in (*self._readers, self._stop_r, self._stop_w):
+            os.close(r)
+        return False
+
+    @staticmethod
+    def _flush_std_streams():
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                if stream is not None:
+                    stream.flush()
+            except Exception:
+                pass
+
+    def _pump(self):
+        with selectors.DefaultSelector() as sel:
+            for r, fd in self._readers.items():
+                sel.register(r, selectors.EVENT_READ, self._splitters[fd])
+            sel.register(self._stop_r, selectors.EVENT_READ, None)
+            while len(sel.get_map()) > 1:
+                for key, _ in sel.select():
+                    if key.data is None:
+                        # Stopped before EOF: flush partial lines and reset
+                        # the decoders for the next capture
+                        for other in list(sel.get_map().values()):
+                            if other.data is not None:
+                                stream, decoder = other.data
+                                stream.write(decoder.decode(b'', final=True) + '\n')
+                        return
+                    stream, decoder = key.data
+                    data = os.read(key.fd, 65536)
+                    if data:
+                        stream.write(decoder.decode(data))
+                    else:
+                        # EOF: emit any unterminated last line (this also
+                        # resets the decoder for the next capture)
+                        stream.write(decoder.decode(b'', final=True) + '\n')
+                        sel.unregister(key.fileobj)
 
 
 class TimecodeGUI:
+    LOG_RING_CAPACITY = 4096
+    # Log widget size: once it exceeds the high mark, the oldest lines are
+    # dropped in one block down to the low mark
+    LOG_TRIM_HIGH_LINES = 5120
+    LOG_TRIM_LOW_LINES = 4096
+    LOG_LINES_PER_TICK = 500
+    # Log polling interval: fast while lines are flowing, backed off once idle
+    LOG_POLL_FAST_MS = 20
+    LOG_POLL_IDLE_MS = 250
+    LOG_IDLE_POLLS_BEFORE_BACKOFF = 10
+    LOG_POLL_WATCHDOG_MS = 500  # safety poll when woken through the pipe
+    PROGRESS_POLL_MS = 1000
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("LTC → SMPTE Timecode")
         self.root.geometry("580x360")
         self.root.minsize(520, 320)
 
-        self.log_queue: queue.Queue[str] = queue.Queue()
-        self.processing_thread: threading.Thread | None = None
+        self.log_queue = RingLog(self.LOG_RING_CAPACITY)
+        self._job_queue: queue.SimpleQueue[Path] = queue.SimpleQueue()
+        self._done_queue: queue.SimpleQueue[tuple[bool, Path | None]] = queue.SimpleQueue()
+        # Output capture for jobs, set up once and reused by every job
+        self._capture = FdCapture(self.log_queue) if FdCapture.available() else StreamCapture(self.log_queue)
+        self._pending_jobs = 0  # submitted but not yet finished; main thread only
+        self._job_progress = 0.0  # fraction of the running job, set by the worker
+        self._progress_after: str | None = None
         self.current_input: Path | None = None
+        self._poll_interval = self.LOG_POLL_IDLE_MS
+        self._empty_polls = 0
+        self._drain_scheduled = False
+        self._line_count = 0
 
         self._build_ui()
+        self._wake_fd = self._setup_wake_pipe()
         self._poll_log_queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
 
     def _build_ui(self):
         style = ttk.Style()
@@ -105,145 +362,202 @@ class TimecodeGUI:
         self.log = tk.Text(wrapper, height=10, wrap="word", state="disabled")
         self.log.pack(fill="both", expand=True)
 
-        self.progress = ttk.Progressbar(wrapper, mode="indeterminate")
+        self.progress = ttk.Progressbar(wrapper, mode="determinate", maximum=100)
         self.progress.pack(fill="x", pady=(8,0))
 
         if _DND_AVAILABLE:
-            # Guard attribute presence (linters may not know custom methods)
-            if hasattr(self.root, 'drop_target_register'):
-                try:
-                    self.root.drop_target_register(DND_FILES)  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-            if hasattr(self.root, 'dnd_bind'):
-                try:
-                    self.root.dnd_bind('<<Drop>>', self._on_drop_event)  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-            if hasattr(self.drop_area, 'drop_target_register'):
-                try:
-                    self.drop_area.drop_target_register(DND_FILES)  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-            if hasattr(self.drop_area, 'dnd_bind'):
-                try:
-                    self.drop_area.dnd_bind('<<Drop>>', self._on_drop_event)  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-
-    def _append_log(self, text: str):
+            self._register_dnd(self.root)
+            self._register_dnd(self.drop_area)
+
+    def _register_dnd(self, widget):
+        # tkinterdnd2 adds these methods to tkinter widgets on import; a widget
+        # without them (e.g. a plain tk.Tk root) just raises AttributeError
+        try:
+            widget.drop_target_register(DND_FILES)  # type: ignore[attr-defined]
+            widget.dnd_bind('<<Drop>>', self._on_drop_event)  # type: ignore[attr-defined]
+        except Exception:
+            pass
+
+    def _append_lines(self, lines: list[str]):
+        # One insert per batch keeps Tcl round-trips independent of line count
+        text = "\n".join(lines) + "\n"
+        self._line_count += text.count("\n")
         self.log.configure(state="normal")
-        self.log.insert("end", text + "\n")
+        self.log.insert("end", text)
+        if self._line_count > self.LOG_TRIM_HIGH_LINES:
+            to_trim = self._line_count - self.LOG_TRIM_LOW_LINES
+            self.log.delete("1.0", f"{to_trim + 1}.0")
+            self._line_count = self.LOG_TRIM_LOW_LINES
         self.log.see("end")
         self.log.configure(state="disabled")
 
     def _queue_log(self, text: str):
+        # Producer side of the ring: call from the worker thread only
         self.log_queue.put(text)
 
+    def _setup_wake_pipe(self) -> int | None:
+        """Let producers wake the Tk loop through a pipe (Unix only).
+
+        Returns the read end, or None where Tk has no file handlers (Windows)
+        and the adaptive poll has to do.
+        """
+        if not hasattr(self.root.tk, 'createfilehandler'):
+            return None
+        r, w = os.pipe()
+        os.set_blocking(r, False)
+        os.set_blocking(w, False)
+        self.root.tk.createfilehandler(r, tk.READABLE, self._on_wake)
+        self.log_queue.wake_fd = w
+        return r
+
+    def _on_wake(self, fd: int, mask: int):
+        try:
+            os.read(fd, 4096)
+        except BlockingIOError:
+            pass
+        self._drain_log()
+
     def _poll_log_queue(self):
+        drained = self._drain_log()
+        if self._wake_fd is not None:
+            # Producers wake us through the pipe; this is just a safety net
+            self._poll_interval = self.LOG_POLL_WATCHDOG_MS
+        elif drained:
+            self._empty_polls = 0
+            self._poll_interval = self.LOG_POLL_FAST_MS
+        else:
+            self._empty_polls += 1
+            if self._empty_polls > self.LOG_IDLE_POLLS_BEFORE_BACKOFF:
+                self._poll_interval = self.LOG_POLL_IDLE_MS
+        self.root.after(self._poll_interval, self._poll_log_queue)
+
+    def _schedule_drain(self):
+        # Main thread only: Tk runs idle callbacks once pending events are
+        # handled, and the flag coalesces repeated requests into one drain
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.root.after_idle(self._drain_log)
+
+    def _drain_log(self) -> int:
+        self._drain_scheduled = False
+        # Cap each drain so a log burst cannot starve the event loop
+        lines = self.log_queue.drain(self.LOG_LINES_PER_TICK)
+        if lines:
+            self._append_lines(lines)
+        if len(lines) == self.LOG_LINES_PER_TICK:
+            # Probably more backlog: continue as soon as the UI is idle rather
+            # than waiting for the next poll. Completions wait until the log
+            # lines before them have been shown.
+            self._schedule_drain()
+            return len(lines)
+        # Finished jobs: handled here so Tk is only touched by this thread
+        done = 0
         while True:
             try:
-                msg = self.log_queue.get_nowait()
+                success, out_path = self._done_queue.get_nowait()
             except queue.Empty:
                 break
-            else:
-                self._append_log(msg)
-        self.root.after(150, self._poll_log_queue)
+            self._on_done(success, out_path)
+            done += 1
+        return len(lines) + done
 
     def _set_input(self, path: Path):
         self.current_input = path
         self.drop_label.configure(text=f"Selected: {path.name}")
         self.process_btn.configure(state="normal")
-        self.status_var.set("Ready to process")
+        if not self._pending_jobs:
+            self.status_var.set("Ready to process")
 
     def _select_file(self):
-        filetypes = [
-            ("Video Files", "*.mp4 *.mov *.mxf *.mkv *.avi"),
-            ("All Files", "*.*")
-        ]
-        filename = filedialog.askopenfilename(title="Select video file", filetypes=filetypes)
+        filename = filedialog.askopenfilename(title="Select video file", filetypes=_FILETYPES)
         if filename:
             self._set_input(Path(filename))
 
     def _on_drop_event(self, event):  # pragma: no cover - GUI event
-        # event.data may contain space-delimited list; only take first for simplicity
-        dropped = event.data.strip().strip('{}')  # On Windows braces sometimes
-        if ' ' in dropped and not Path(dropped).exists():
-            # Likely list of files, take first token
-            dropped = dropped.split()[0]
-        p = Path(dropped)
-        if p.exists():
-            self._set_input(p)
-        else:
-            messagebox.showerror("Invalid file", f"File does not exist: {p}")
+        # event.data is a Tcl list (brace-quoting, backslash escapes); let Tcl
+        # split it and take the first entry as-is. A path that cannot be
+        # opened is reported when the job runs.
+        paths = [p for p in self.root.tk.splitlist(event.data) if p]
+        if paths:
+            self._set_input(Path(paths[0]))
 
     def _start_processing(self):
         if not self.current_input:
             return
-        if self.processing_thread and self.processing_thread.is_alive():
-            messagebox.showinfo("Busy", "Already processing a file.")
-            return
-        self.status_var.set("Processing…")
-        self.progress.start(10)
-        self.process_btn.configure(state="disabled")
+        if not self._pending_jobs:
+            self._job_progress = 0.0
+            self.progress["value"] = 0
+        self._pending_jobs += 1
+        if self._progress_after is None:
+            self._poll_progress()
+        self._show_pending()
         self.open_dir_btn.configure(state="disabled")
-        self._queue_log(f"Starting processing: {self.current_input}")
-        self.processing_thread = threading.Thread(target=self._process_worker, daemon=True)
-        self.processing_thread.start()
-
-    def _process_worker(self):
-        assert self.current_input is not None
-        input_path = str(self.current_input)
-        # Stream object to capture stdout/stderr and forward lines into GUI queue
-        class QueueStream:
-            def __init__(self, q: queue.Queue[str], tag: str):
-                self.q = q
-                self.tag = tag
-                self._buffer = ""
-            def write(self, data: str):  # pragma: no cover - simple passthrough
-                if not data:
-                    return
-                self._buffer += data
-                while '\n' in self._buffer:
-                    line, self._buffer = self._buffer.split('\n', 1)
-                    line = line.rstrip('\r')
-                    if line.strip():
-                        self.q.put(f"{self.tag} {line}")
-            def flush(self):  # pragma: no cover - not used
-                pass
+        self._job_queue.put(self.current_input)
 
-        orig_stdout, orig_stderr = sys.stdout, sys.stderr
-        sys.stdout = QueueStream(self.log_queue, "[stdout]")  # type: ignore
-        sys.stderr = QueueStream(self.log_queue, "[stderr]")  # type: ignore
-        self._queue_log("--- Backend log capture started ---")
-        try:
-            success = process_video(input_path)
-        except Exception as e:  # pragma: no cover
-            success = False
-            # Ensure exception text visible
-            self._queue_log(f"[exception] {e}")
-        finally:
-            # Flush any remainder
-            try:
-                sys.stdout.flush()
-                sys.stderr.flush()
-            except Exception:
-                pass
-            sys.stdout, sys.stderr = orig_stdout, orig_stderr
-            self._queue_log("--- Backend log capture finished ---")
+    def _show_pending(self):
+        queued = self._pending_jobs - 1
+        self.status_var.set("Processing…" if not queued else f"Processing… ({queued} queued)")
 
-        if success:
-            out_path = Path(input_path).with_name(Path(input_path).stem + '_tc' + Path(input_path).suffix)
-            self._queue_log(f"✓ Done: {out_path}")
-            self.root.after(0, lambda: self._on_done(True, out_path))
+    def _poll_progress(self):
+        # Refresh the bar once per second from the worker's progress value
+        self.progress["value"] = self._job_progress * 100
+        if self._pending_jobs:
+            self._progress_after = self.root.after(self.PROGRESS_POLL_MS, self._poll_progress)
         else:
-            self._queue_log("✗ Failed")
-            self.root.after(0, lambda: self._on_done(False, None))
+            self._progress_after = None
+
+    def _report_progress(self, fraction: float):
+        # Worker side: a plain attribute store, read by _poll_progress
+        self._job_progress = fraction
+
+    def _worker_loop(self):
+        # One long-lived worker runs jobs in submission order. Whatever a job
+        # raises (e.g. SystemExit from the backend's prerequisite check), it is
+        # reported as failed and the loop keeps serving the queue.
+        while True:
+            in_path = self._job_queue.get()
+            out_path = in_path.with_name(in_path.stem + '_tc' + in_path.suffix)
+            success = False
+            try:
+                success = self._run_job(in_path, out_path)
+            except BaseException as e:  # pragma: no cover
+                self._queue_log(f"[exception] {type(e).__name__}: {e}")
+            finally:
+                # Completion goes through a lossless queue (the ring may
+                # overwrite); the log line queued after it wakes the GUI
+                if success:
+                    self._done_queue.put((True, out_path))
+                    self._queue_log(f"✓ Done: {out_path}")
+                else:
+                    self._done_queue.put((False, None))
+                    self._queue_log("✗ Failed")
+
+    def _run_job(self, in_path: Path, out_path: Path) -> bool:
+        self._queue_log(f"Starting processing: {in_path}")
+        self._job_progress = 0.0
+        self._queue_log("--- Backend log capture started ---")
+        error: BaseException | None = None
+        with self._capture:
+            try:
+                success = process_video(str(in_path), str(out_path), progress=self._report_progress)
+            except BaseException as e:  # pragma: no cover
+                success = False
+                error = e
+        if error is not None:
+            # Ensure exception text visible
+            self._queue_log(f"[exception] {type(error).__name__}: {error}")
+        self._queue_log("--- Backend log capture finished ---")
+        return success
 
     def _on_done(self, success: bool, out_path: Path | None):
-        self.progress.stop()
-        self.status_var.set("Completed" if success else "Failed")
-        self.process_btn.configure(state="normal")
+        self._pending_jobs -= 1
+        if self._pending_jobs:
+            self._show_pending()
+        else:
+            self.status_var.set("Completed" if success else "Failed")
+            if not success:
+                self._job_progress = 0.0
+                self.progress["value"] = 0
         if success and out_path:
             self.last_output = out_path
             self.open_dir_btn.configure(state="normal")
@@ -255,23 +569,18 @@ class TimecodeGUI:
         if not out:
             return
         try:
-            if sys.platform == 'darwin':
-                import subprocess
-                subprocess.run(['open', '--', str(out.parent)])
-            elif sys.platform.startswith('win'):
-                import subprocess
-                subprocess.run(['explorer', str(out.parent)])
-            else:  # linux
-                import subprocess
-                subprocess.run(['xdg-open', str(out.parent)])
+            # Detached from our stdio: fds 1/2 may be a job's capture pipes,
+            # which a lingering file manager process would otherwise keep open
+            subprocess.run([*_OPEN_FOLDER_CMD, str(out.parent)],
+                           stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception as e:
             messagebox.showerror("Open Folder", f"Could not open folder: {e}")
 
 
 def run():  # pragma: no cover - entry point
-    if _DND_AVAILABLE and hasattr(TkinterDnD, 'Tk'):
+    if _DND_TK is not None:
         try:
-            root = TkinterDnD.Tk()  # type: ignore[attr-defined]
+            root = _DND_TK()
         except Exception:
             root = tk.Tk()
     else: